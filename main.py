@@ -1,5 +1,7 @@
 import asyncio
+import contextlib
 import logging
+import signal
 
 from okc_py import OKC
 from okc_py.config import Settings
@@ -24,6 +26,9 @@ async def main():
     setup_logging()
     logger.info("Запуск парсера...")
 
+    # Корутины, завершившиеся без ожидания, не планируются в цикле событий
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     okc_client = OKC(
         username=settings.OKC_USERNAME,
         password=settings.OKC_PASSWORD,
@@ -48,18 +53,18 @@ async def main():
                     lines=settings.WS_LINES,
                 )
                 logger.info(
-                    f"WebSocket bridges настроены для линий: {settings.WS_LINES}"
+                    "WebSocket bridges настроены для линий: %s", settings.WS_LINES
                 )
             except Exception as e:
-                logger.warning(f"Не удалось настроить WebSocket bridges: {e}")
+                logger.warning("Не удалось настроить WebSocket bridges: %s", e)
 
         except Exception as e:
-            logger.warning(f"Не удалось настроить NATS: {e}")
+            logger.warning("Не удалось настроить NATS: %s", e)
 
         db_url = None
         if settings.SCHEDULER_ENABLE_PERSISTENCE and settings.SCHEDULER_JOB_STORE_URL:
             db_url = settings.SCHEDULER_JOB_STORE_URL
-            logger.info(f"Scheduler persistence enabled with DB: {db_url}")
+            logger.info("Scheduler persistence enabled with DB: %s", db_url)
 
         # Инициализация планировщика
         scheduler = Scheduler(
@@ -72,10 +77,13 @@ async def main():
             logger.info("Планировщик запущен")
 
             status = scheduler.get_job_status()
-            logger.info(f"Запланированные задачи: {len(status['jobs'])}")
+            logger.info("Запланированные задачи: %s", len(status["jobs"]))
             for job in status["jobs"]:
                 logger.info(
-                    f"  - {job['name']} (ID: {job['id']}) - Next run: {job['next_run']}"
+                    "  - %s (ID: %s) - Next run: %s",
+                    job["name"],
+                    job["id"],
+                    job["next_run"],
                 )
 
             if settings.ENVIRONMENT != "dev":
@@ -90,22 +98,34 @@ async def main():
                 await fill_assigned_tests(okc_client.api.tests)
                 logger.info("Получение данных при старте завершено")
 
+            # Ожидание сигнала остановки без периодических пробуждений event loop
+            stop_event = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                with contextlib.suppress(NotImplementedError):
+                    loop.add_signal_handler(sig, stop_event.set)
+
             try:
-                while True:
-                    await asyncio.sleep(10)
+                while not stop_event.is_set():
+                    if not logger.isEnabledFor(logging.DEBUG):
+                        await stop_event.wait()
+                        break
 
-                    if logger.isEnabledFor(logging.DEBUG):
-                        status = scheduler.get_job_status()
-                        logger.debug(f"Scheduler stats: {status['stats']}")
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(stop_event.wait(), timeout=10)
+                    status = scheduler.get_job_status()
+                    logger.debug("Scheduler stats: %s", status["stats"])
+
+                logger.info("Stop signal received. Shutting down gracefully...")
 
             except KeyboardInterrupt:
                 logger.info("Keyboard interrupt received. Shutting down gracefully...")
             except Exception as e:
-                logger.error(f"Unexpected error in main loop: {e}")
+                logger.error("Unexpected error in main loop: %s", e)
                 raise
 
     except Exception as e:
-        logger.error(f"Error in main: {e}", exc_info=True)
+        logger.error("Error in main: %s", e, exc_info=True)
         raise
 
     finally:
@@ -113,15 +133,20 @@ async def main():
         try:
             await cleanup_ws_bridges()
         except Exception as e:
-            logger.warning(f"Ошибка при закрытии WebSocket bridges: {e}")
+            logger.warning("Ошибка при закрытии WebSocket bridges: %s", e)
 
         try:
             await nats_client.disconnect()
         except Exception as e:
-            logger.warning(f"Ошибка при закрытии NATS соединения: {e}")
+            logger.warning("Ошибка при закрытии NATS соединения: %s", e)
 
         await okc_client.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # uvloop недоступен на Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,7 +1,4 @@
-import json
-
 import pytz
-from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pytz.tzinfo import DstTzInfo
 
@@ -13,6 +10,7 @@ class Settings(BaseSettings):
     OKC_USERNAME: str
     OKC_PASSWORD: str
     OKC_BASE_URL: str
+    OKC_MAX_CONCURRENT_REQUESTS: int = 32  # Общий лимит одновременных запросов к API
 
     # Настройки БД
     DB_HOST: str
@@ -37,25 +35,19 @@ class Settings(BaseSettings):
         "ntp2",
     ]  # Линии для подключения: nck, ntp1, ntp2
 
-    @field_validator("WS_LINES", mode="before")
-    @classmethod
-    def parse_ws_lines(cls, v):
-        """Parse WS_LINES from JSON string or list."""
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                # If comma-separated string
-                return [line.strip() for line in v.split(",")]
-        return v
-
     # Настройки планировщика
     SCHEDULER_ENABLE_PERSISTENCE: bool = False
     SCHEDULER_MAX_WORKERS: int = 5
     SCHEDULER_TIMEZONE: DstTzInfo = pytz.timezone("Asia/Yekaterinburg")
     SCHEDULER_JOB_STORE_URL: str = ""
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        frozen=True,
+        validate_default=False,
+        extra="ignore",
+    )
 
 
 settings = Settings()
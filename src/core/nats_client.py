@@ -1,11 +1,11 @@
 import asyncio
-import json
 import logging
 from collections.abc import Callable
 from typing import Any
 
 import nats
 from nats.aio.client import Client as NATS
+from pydantic_core import from_json, to_json
 
 from src.core.config import settings
 
@@ -68,24 +68,22 @@ class NATSClient:
         """Handle incoming NATS messages"""
         try:
             # Parse message data - handle both JSON and plain string formats
-            message_text = msg.data.decode()
-
             try:
-                # Try to parse as JSON first
-                data = json.loads(message_text)
+                # Try to parse raw bytes as JSON first (no intermediate decode)
+                data = from_json(msg.data)
                 command = data.get("command")
                 params = data.get("params", {})
-            except json.JSONDecodeError:
+            except ValueError:
                 # If JSON parsing fails, treat as simple string command
-                command = message_text.strip()
+                command = msg.data.decode().strip()
                 params = {}
                 logger.info(f"Received simple string command: {command}")
 
             logger.info(f"Received command: {command} with params: {params}")
 
             # Find and execute handler
-            if command in self.command_handlers:
-                handler = self.command_handlers[command]
+            handler = self.command_handlers.get(command)
+            if handler is not None:
                 try:
                     result = await handler(**params)
 
@@ -96,10 +94,7 @@ class NATSClient:
                             "data": result,
                             "command": command,
                         }
-                        await self.nc.publish(
-                            msg.reply,
-                            json.dumps(response, ensure_ascii=False).encode("utf-8"),
-                        )
+                        await self.nc.publish(msg.reply, to_json(response))
                         logger.debug(f"Sent response for command {command}")
 
                 except Exception as e:
@@ -112,12 +107,7 @@ class NATSClient:
                             "error": str(e),
                             "command": command,
                         }
-                        await self.nc.publish(
-                            msg.reply,
-                            json.dumps(error_response, ensure_ascii=False).encode(
-                                "utf-8"
-                            ),
-                        )
+                        await self.nc.publish(msg.reply, to_json(error_response))
             else:
                 logger.warning(f"No handler found for command: {command}")
 
@@ -128,10 +118,7 @@ class NATSClient:
                         "error": f"Unknown command: {command}",
                         "command": command,
                     }
-                    await self.nc.publish(
-                        msg.reply,
-                        json.dumps(error_response, ensure_ascii=False).encode("utf-8"),
-                    )
+                    await self.nc.publish(msg.reply, to_json(error_response))
 
         except Exception as e:
             logger.error(f"Error processing NATS message: {e}")
@@ -150,10 +137,10 @@ class NATSClient:
 
         try:
             response = await self.nc.request(
-                settings.NATS_SUBJECT, json.dumps(message).encode(), timeout=timeout
+                settings.NATS_SUBJECT, to_json(message), timeout=timeout
             )
 
-            result = json.loads(response.data.decode())
+            result = from_json(response.data)
 
             if result.get("status") == "error":
                 raise Exception(result.get("error", "Unknown error"))
@@ -34,9 +34,10 @@ def serialize_object(obj: Any) -> Any:
     if is_dataclass(obj):
         return serialize_object(asdict(obj))
 
-    # Handle objects with model_dump (Pydantic v2)
+    # Handle objects with model_dump (Pydantic v2) - already validated API models,
+    # so dump straight to JSON-safe types in pydantic-core without re-walking them
     if hasattr(obj, "model_dump"):
-        return serialize_object(obj.model_dump())
+        return obj.model_dump(mode="json")
 
     # Handle objects with dict() method (Pydantic v1)
     if hasattr(obj, "dict") and callable(obj.dict):
@@ -140,16 +141,16 @@ class NATSRouter:
             api_name, method_name = target.split(".", 1)
 
             # Get API instance
-            if api_name not in self.api_map:
+            api_instance = self.api_map.get(api_name)
+            if api_instance is None:
                 available_apis = list(self.api_map.keys())
                 return {
                     "error": f"Unknown API: {api_name}. Available APIs: {available_apis}"
                 }
 
-            api_instance = self.api_map[api_name]
-
             # Get method from API instance
-            if not hasattr(api_instance, method_name):
+            method = getattr(api_instance, method_name, None)
+            if method is None:
                 available_methods = [
                     method
                     for method in dir(api_instance)
@@ -160,8 +161,6 @@ class NATSRouter:
                     "error": f"Unknown method: {method_name} on {api_name}. Available methods: {available_methods}"
                 }
 
-            method = getattr(api_instance, method_name)
-
             # Call the method with provided parameters
             logger.info(f"Calling {api_name}.{method_name} with params: {params}")
 
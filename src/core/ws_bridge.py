@@ -1,12 +1,12 @@
 """WebSocket to NATS bridge for OKC lines data."""
 
 import asyncio
-import json
 import logging
 from typing import Any
 
 from okc_py import OKC
 from okc_py.sockets.models import RawData, RawIncidents
+from pydantic_core import to_json
 
 from src.core.config import settings
 from src.core.nats_client import nats_client
@@ -139,18 +139,22 @@ class WebSocketBridge:
         """Handle rawData events from WebSocket."""
         try:
             # Validate data using Pydantic model
-            raw_data = RawData(**data)
+            raw_data = RawData.model_validate(data)
 
             # Prepare message for NATS
             message = {
                 "type": "rawData",
                 "line": self.line_name,
                 "timestamp": asyncio.get_event_loop().time(),
-                "data": self._serialize_raw_data(raw_data),
+                "data": raw_data,
             }
 
             # Publish to NATS with line-specific subject
-            await self._publish_to_nats(message, f"ws_line_{self.line_name}")
+            await self._publish_to_nats(
+                message,
+                f"ws_line_{self.line_name}",
+                by_alias=raw_data.model_config.get("serialize_by_alias", False),
+            )
 
             logger.debug(f"Published rawData event from {self.line_name}")
 
@@ -161,48 +165,49 @@ class WebSocketBridge:
         """Handle rawIncidents events from WebSocket."""
         try:
             # Validate data using Pydantic model
-            incidents = RawIncidents(**data)
+            incidents = RawIncidents.model_validate(data)
 
             # Prepare message for NATS
             message = {
                 "type": "rawIncidents",
                 "line": self.line_name,
                 "timestamp": asyncio.get_event_loop().time(),
-                "data": self._serialize_raw_incidents(incidents),
+                "data": incidents,
             }
 
             # Publish to NATS with line-specific subject
-            await self._publish_to_nats(message, f"ws_line_{self.line_name}")
+            await self._publish_to_nats(
+                message,
+                f"ws_line_{self.line_name}",
+                by_alias=incidents.model_config.get("serialize_by_alias", False),
+            )
 
             logger.debug(f"Published rawIncidents event from {self.line_name}")
 
         except Exception as e:
             logger.error(f"Error processing rawIncidents event: {e}")
 
-    async def _publish_to_nats(self, message: dict[str, Any], subject: str) -> None:
-        """Publish message to NATS with specified subject."""
+    async def _publish_to_nats(
+        self, message: dict[str, Any], subject: str, by_alias: bool = False
+    ) -> None:
+        """Publish message to NATS with specified subject.
+
+        to_json applies one by_alias to the whole message instead of following
+        each model's serialize_by_alias config like model_dump does, so callers
+        pass the config of the model they publish.
+        """
         try:
             if nats_client.nc:
-                await nats_client.nc.publish(
-                    subject,
-                    json.dumps(message, ensure_ascii=False, default=str).encode(
-                        "utf-8"
-                    ),
+                payload = to_json(
+                    message, exclude_none=True, by_alias=by_alias, fallback=str
                 )
+                await nats_client.nc.publish(subject, payload)
             else:
                 logger.warning("NATS client not connected, cannot publish message")
 
         except Exception as e:
             logger.error(f"[{self.line_name}] Error publishing to NATS: {e}")
 
-    def _serialize_raw_data(self, raw_data: RawData) -> dict[str, Any]:
-        """Serialize RawData object to dictionary using Pydantic model_dump."""
-        return raw_data.model_dump(mode="json", exclude_none=True)
-
-    def _serialize_raw_incidents(self, incidents: RawIncidents) -> dict[str, Any]:
-        """Serialize RawIncidents object to dictionary using Pydantic model_dump."""
-        return incidents.model_dump(mode="json", exclude_none=True)
-
     async def stop(self) -> None:
         """Stop the WebSocket bridge."""
         logger.info("Stopping WebSocket bridge...")
@@ -1 +1,2 @@
 unites = ["НТП1", "НТП2", "НЦК"]
+head_unites = ["НТП", "НЦК"]
@@ -1,15 +1,26 @@
 import asyncio
 import calendar
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import datetime
+from itertools import batched
 from time import perf_counter
 from typing import Any
 
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT executemany in bulk writes
+INSERT_BATCH_SIZE = 1000
+
+# Process-wide cap on in-flight API requests, shared by every fetcher so that
+# concurrent fills (e.g. day/week/month KPI) cannot multiply the fan-out
+API_SEMAPHORE = asyncio.Semaphore(settings.OKC_MAX_CONCURRENT_REQUESTS)
+
 
 def log_processing_time(operation_name: str):
     """Декоратор для логирования времени запуска задач."""
@@ -17,19 +28,22 @@ def log_processing_time(operation_name: str):
     def decorator(func):
         async def wrapper(*args, **kwargs):
             timer_start = perf_counter()
-            logger.info(f"Starting {operation_name}")
+            logger.info("Starting %s", operation_name)
 
             try:
                 result = await func(*args, **kwargs)
                 timer_stop = perf_counter()
                 logger.info(
-                    f"Completed {operation_name} in {timer_stop - timer_start:.2f}s"
+                    "Completed %s in %.2fs", operation_name, timer_stop - timer_start
                 )
                 return result
             except Exception as e:
                 timer_stop = perf_counter()
                 logger.error(
-                    f"Error in {operation_name} after {timer_stop - timer_start:.2f}s: {e}"
+                    "Error in %s after %.2fs: %s",
+                    operation_name,
+                    timer_stop - timer_start,
+                    e,
                 )
                 raise
 
@@ -39,7 +53,7 @@ def log_processing_time(operation_name: str):
 
 
 class ConcurrentAPIFetcher:
-    """Utility for parallel API requests with semaphore limiting."""
+    """Utility for parallel API requests with a bounded worker pool."""
 
     def __init__(self, semaphore_limit: int = 10):
         self.semaphore_limit = semaphore_limit
@@ -51,33 +65,42 @@ class ConcurrentAPIFetcher:
         task_executor: Callable[..., Any],
     ) -> list[tuple[Any, ...]]:
         """
-        Execute list of tasks in parallel with semaphore limiting.
+        Execute list of tasks in parallel with a fixed pool of workers.
+
+        At most semaphore_limit workers drain a queue of task indexes, so memory
+        stays O(workers) instead of one coroutine and Task per task up front.
+        A failed task leaves None in its slot and does not cancel the group.
+        Requests across all fetchers are additionally capped by API_SEMAPHORE.
 
         Args:
             tasks: List of tuples with parameters for task_executor
             task_executor: Function to execute each task
 
         Returns:
-            List of results in same order as tasks
+            List of (task, result) in same order as tasks, result is None on failure
         """
-        semaphore = asyncio.Semaphore(self.semaphore_limit)
-
-        async def limited_task(task_params):
-            async with semaphore:
-                return await task_executor(*task_params)
-
-        coroutines = [limited_task(task) for task in tasks]
-        results = await asyncio.gather(*coroutines, return_exceptions=True)
-
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self.logger.error(f"Task {i} failed: {result}")
-                processed_results.append((tasks[i], None))
-            else:
-                processed_results.append((tasks[i], result))
-
-        return processed_results
+        results: list[Any] = [None] * len(tasks)
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for i in range(len(tasks)):
+            queue.put_nowait(i)
+
+        async def worker():
+            while True:
+                try:
+                    i = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    async with API_SEMAPHORE:
+                        results[i] = await task_executor(*tasks[i])
+                except Exception as e:
+                    self.logger.error("Task %s failed: %s", i, e)
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(min(self.semaphore_limit, len(tasks))):
+                tg.create_task(worker())
+
+        return list(zip(tasks, results, strict=True))
 
 
 class BatchDBOperator:
@@ -89,76 +112,111 @@ class BatchDBOperator:
 
     async def bulk_insert_with_cleanup(
         self,
-        data_list: list[Any],
+        model: type,
+        data_list: Iterable[dict[str, Any]],
         delete_func: Callable[[], Any] | None,
         operation_name: str,
+        batch_size: int = INSERT_BATCH_SIZE,
+        raise_on_error: bool = False,
     ) -> int:
         """
         Bulk insert with optional cleanup.
 
+        Rows are written with Core-style INSERT executemany in batches, which skips
+        ORM instance state and unit-of-work bookkeeping for write-only data.
+        data_list may be a generator: only one batch is materialized at a time,
+        and if it yields nothing the cleanup is rolled back.
+
         Args:
-            data_list: List of objects to insert
+            model: SQLAlchemy model to insert into
+            data_list: Column -> value dictionaries to insert
             delete_func: Optional function to delete old data
             operation_name: Operation name for logging
+            batch_size: Number of rows per INSERT batch
+            raise_on_error: Re-raise after rollback instead of returning 0
 
         Returns:
             Number of records inserted
         """
         if not data_list:
-            self.logger.warning(f"[{operation_name}] No data to insert")
+            self.logger.warning("[%s] No data to insert", operation_name)
             return 0
 
         try:
             if delete_func:
                 await delete_func()
 
-            self.session.add_all(data_list)
+            inserted = 0
+            for batch in batched(data_list, batch_size):
+                await self.session.execute(insert(model), list(batch))
+                inserted += len(batch)
+
+            if not inserted:
+                self.logger.warning("[%s] No data to insert", operation_name)
+                await self.session.rollback()
+                return 0
+
             await self.session.commit()
 
-            self.logger.info(f"[{operation_name}] Inserted {len(data_list)} records")
-            return len(data_list)
+            self.logger.info("[%s] Inserted %s records", operation_name, inserted)
+            return inserted
 
         except Exception as e:
-            self.logger.error(f"[{operation_name}] Bulk insert failed: {e}")
+            self.logger.error(
+                "[%s] Bulk insert failed: %s", operation_name, e, exc_info=True
+            )
             await self.session.rollback()
+            if raise_on_error:
+                raise
             return 0
 
     async def bulk_update_with_transaction(
         self,
         updates: list[dict[str, Any]],
-        update_func: Callable[[dict[str, Any]], Any],
         operation_name: str,
+        model: type | None = None,
+        update_func: Callable[[dict[str, Any]], Any] | None = None,
     ) -> int:
         """
         Execute bulk updates in a single transaction.
 
+        With model set, all rows are sent as one ORM bulk UPDATE by primary key
+        (a single executemany). update_func keeps the per-row path for updates
+        that cannot be expressed as plain column values.
+
         Args:
-            updates: List of dictionaries with update data
-            update_func: Function to perform single update
+            updates: List of dictionaries with update data (including primary key for model)
             operation_name: Operation name for logging
+            model: SQLAlchemy model to bulk update by primary key
+            update_func: Function to perform single update (fallback)
 
         Returns:
             Number of records updated
         """
         if not updates:
-            self.logger.info(f"[{operation_name}] No data to update")
+            self.logger.info("[%s] No data to update", operation_name)
             return 0
 
-        try:
-            updated_count = 0
+        if model is None and update_func is None:
+            raise ValueError("Either model or update_func must be provided")
 
-            for update_data in updates:
-                await update_func(update_data)
-                updated_count += 1
+        try:
+            if model is not None:
+                await self.session.execute(update(model), updates)
+            else:
+                for update_data in updates:
+                    await update_func(update_data)
 
             await self.session.commit()
             self.logger.info(
-                f"[{operation_name}] Updated {updated_count} records in one transaction"
+                "[%s] Updated %s records in one transaction",
+                operation_name,
+                len(updates),
             )
-            return updated_count
+            return len(updates)
 
         except Exception as e:
-            self.logger.error(f"[{operation_name}] Bulk update failed: {e}")
+            self.logger.error("[%s] Bulk update failed: %s", operation_name, e)
             await self.session.rollback()
             return 0
 
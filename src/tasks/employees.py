@@ -1,5 +1,8 @@
 import logging
+from collections import Counter
+from collections.abc import Iterable
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 from okc_py import DossierAPI, TutorsAPI
@@ -23,11 +26,30 @@ def parse_date(date_str: str | None) -> datetime | None:
         return None
 
 
-async def find_employee_by_fullname(session, fullname: str) -> Employee | None:
-    """Find employee by fullname in database."""
-    stmt = select(Employee).where(Employee.fullname == fullname)
+async def find_employees_by_fullnames(
+    session, fullnames: Iterable[str]
+) -> dict[str, Employee]:
+    """Find employees by fullname in database, keyed by fullname.
+
+    Fullnames shared by several employees are ambiguous, they are logged and
+    left out of the result.
+    """
+    stmt = select(Employee).where(Employee.fullname.in_(set(fullnames)))
     result = await session.execute(stmt)
-    return result.scalar_one_or_none()
+    employees = result.scalars().all()
+    name_counts = Counter(map(attrgetter("fullname"), employees))
+    duplicates = sorted(name for name, count in name_counts.items() if count > 1)
+    if duplicates:
+        logger.warning(
+            "Skipping %s fullnames matching several employees: %s",
+            len(duplicates),
+            duplicates,
+        )
+    return {
+        employee.fullname: employee
+        for employee in employees
+        if name_counts[employee.fullname] == 1
+    }
 
 
 async def fetch_employee_details_concurrent(
@@ -40,20 +62,19 @@ async def fetch_employee_details_concurrent(
 
     IMPORTANT: This function expects database Employee objects with 'employee_id' attribute.
     The DossierAPI.get_employee() method requires employee_id (OKC ID).
+    Results are aligned with employees, None where there is no employee_id or
+    the request failed, so callers can zip them with strict=True.
     """
 
     async def fetch_detail(employee_id: int):
         return await dossier_api.get_employee(employee_id=employee_id, **api_kwargs)
 
     # Extract employee_id from database Employee objects
-    tasks = [
-        (e.employee_id,)
-        for e in employees
-        if hasattr(e, "employee_id") and e.employee_id
-    ]
+    employee_ids = [getattr(e, "employee_id", None) for e in employees]
+    tasks = [(employee_id,) for employee_id in employee_ids if employee_id]
     fetcher = ConcurrentAPIFetcher(semaphore_limit=semaphore_limit)
-    results = await fetcher.fetch_parallel(tasks, fetch_detail)
-    return [result for _, result in results if result is not None]
+    results = iter(await fetcher.fetch_parallel(tasks, fetch_detail))
+    return [next(results)[1] if employee_id else None for employee_id in employee_ids]
 
 
 @log_processing_time("Employee birthdays update")
@@ -65,22 +86,25 @@ async def update_birthdays(dossier_api: DossierAPI) -> int:
         logger.warning("[Employees] No employees data received from API")
         return 0
 
-    logger.info(f"[Employees] Processing {len(employees_data)} employees")
+    logger.info("[Employees] Processing %s employees", len(employees_data))
 
     updated_count = 0
     async with get_stp_session() as session:
+        db_employees = await find_employees_by_fullnames(
+            session, (e.fullname for e in employees_data if e.fullname)
+        )
         for emp_pydantic in employees_data:
             if not emp_pydantic.fullname:
                 continue
 
-            db_emp = await find_employee_by_fullname(session, emp_pydantic.fullname)
+            db_emp = db_employees.get(emp_pydantic.fullname)
             if db_emp and emp_pydantic.fired_date:
                 db_emp.fired_date = parse_date(emp_pydantic.fired_date)
                 updated_count += 1
 
         await session.commit()
 
-    logger.info(f"[Employees] Updated {updated_count} employee records")
+    logger.info("[Employees] Updated %s employee records", updated_count)
     return updated_count
 
 
@@ -104,12 +128,14 @@ async def update_employment_dates(dossier_api: DossierAPI) -> int:
         return 0
 
     logger.info(
-        f"[Employees] Found {len(db_employees_needing_update)} employees missing employment_date"
+        "[Employees] Found %s employees missing employment_date",
+        len(db_employees_needing_update),
     )
 
     # Fetch detailed data using employee_id from database (concurrently)
     logger.info(
-        f"[Employees] Fetching details for {len(db_employees_needing_update)} employees..."
+        "[Employees] Fetching details for %s employees...",
+        len(db_employees_needing_update),
     )
     emp_details = await fetch_employee_details_concurrent(
         dossier_api, db_employees_needing_update, semaphore_limit=10
@@ -133,7 +159,7 @@ async def update_employment_dates(dossier_api: DossierAPI) -> int:
 
         await session.commit()
 
-    logger.info(f"[Employees] Updated {updated_count} employment dates")
+    logger.info("[Employees] Updated %s employment dates", updated_count)
     return updated_count
 
 
@@ -153,7 +179,8 @@ async def update_employee_ids(dossier_api: DossierAPI) -> int:
         return 0
 
     logger.info(
-        f"[Employees] Found {len(db_employees_needing_update)} employees missing employee_id"
+        "[Employees] Found %s employees missing employee_id",
+        len(db_employees_needing_update),
     )
 
     # Get all employees from API (single call) - the API response includes the employee ID
@@ -162,7 +189,7 @@ async def update_employee_ids(dossier_api: DossierAPI) -> int:
         logger.warning("[Employees] No employees data received from API")
         return 0
 
-    logger.info(f"[Employees] Retrieved {len(employees_data)} employees from API")
+    logger.info("[Employees] Retrieved %s employees from API", len(employees_data))
 
     # Match by fullname and update employee_id
     api_employees_by_fullname = {e.fullname: e for e in employees_data if e.fullname}
@@ -170,14 +197,14 @@ async def update_employee_ids(dossier_api: DossierAPI) -> int:
 
     async with get_stp_session() as session:
         for db_emp in db_employees_needing_update:
-            if db_emp.fullname in api_employees_by_fullname:
-                api_emp = api_employees_by_fullname[db_emp.fullname]
+            api_emp = api_employees_by_fullname.get(db_emp.fullname)
+            if api_emp is not None:
                 db_emp.employee_id = api_emp.id
                 updated_count += 1
 
         await session.commit()
 
-    logger.info(f"[Employees] Updated {updated_count} employee IDs")
+    logger.info("[Employees] Updated %s employee IDs", updated_count)
     return updated_count
 
 
@@ -212,12 +239,14 @@ async def update_all_employee_data(dossier_api: DossierAPI) -> int:
         return 0
 
     logger.info(
-        f"[Employees] Found {len(db_employees_needing_update)} employees missing employment_date/birthday"
+        "[Employees] Found %s employees missing employment_date/birthday",
+        len(db_employees_needing_update),
     )
 
     # Step 3: Fetch detailed data using employee_id from database
     logger.info(
-        f"[Employees] Fetching details for {len(db_employees_needing_update)} employees..."
+        "[Employees] Fetching details for %s employees...",
+        len(db_employees_needing_update),
     )
     emp_details = await fetch_employee_details_concurrent(
         dossier_api,
@@ -233,11 +262,8 @@ async def update_all_employee_data(dossier_api: DossierAPI) -> int:
         for db_emp, emp_detail in zip(
             db_employees_needing_update, emp_details, strict=True
         ):
+            # Failed requests are already logged by the fetcher
             if not emp_detail or not emp_detail.employeeInfo:
-                if isinstance(emp_detail, Exception):
-                    logger.warning(
-                        f"[Employees] Error fetching employee_id={db_emp.employee_id}: {emp_detail}"
-                    )
                 continue
 
             info: EmployeeInfo = emp_detail.employeeInfo
@@ -257,7 +283,8 @@ async def update_all_employee_data(dossier_api: DossierAPI) -> int:
         await session.commit()
 
     logger.info(
-        f"[Employees] Updated {updated_count} employee records with employment_date/birthday"
+        "[Employees] Updated %s employee records with employment_date/birthday",
+        updated_count,
     )
     return updated_count
 
@@ -286,7 +313,7 @@ async def update_tutor_info(tutors_api: TutorsAPI) -> int:
     start_date, _ = PeriodHelper.get_date_range_for_period(first_period)
     _, end_date = PeriodHelper.get_date_range_for_period(last_period)
 
-    logger.info(f"[Employees] Fetching tutor data from {start_date} to {end_date}")
+    logger.info("[Employees] Fetching tutor data from %s to %s", start_date, end_date)
 
     # Get all tutors
     picked_units = [u.id for u in graph_filters.units]
@@ -306,7 +333,7 @@ async def update_tutor_info(tutors_api: TutorsAPI) -> int:
         logger.warning("[Employees] No tutor data received from API")
         return 0
 
-    logger.info(f"[Employees] Retrieved {len(tutor_graph.tutors)} tutors from API")
+    logger.info("[Employees] Retrieved %s tutors from API", len(tutor_graph.tutors))
 
     # Create tutor lookup
     tutors_dict = {}
@@ -314,10 +341,11 @@ async def update_tutor_info(tutors_api: TutorsAPI) -> int:
     for tutor in tutor_graph.tutors:
         ti = tutor.tutor_info
         logger.debug(
-            f"[Employees] Tutor info - Name: {ti.full_name}, "
-            f"ID: {ti.employee_id}, "
-            f"Type: {ti.tutor_type}, "
-            f"Subtype: {ti.tutor_subtype}"
+            "[Employees] Tutor info - Name: %s, ID: %s, Type: %s, Subtype: %s",
+            ti.full_name,
+            ti.employee_id,
+            ti.tutor_type,
+            ti.tutor_subtype,
         )
         if ti.tutor_subtype:
             subtype_stats["with_subtype"] += 1
@@ -331,17 +359,18 @@ async def update_tutor_info(tutors_api: TutorsAPI) -> int:
         }
 
     logger.info(
-        f"[Employees] Tutor subtype stats: "
-        f"{subtype_stats['with_subtype']} with subtype, "
-        f"{subtype_stats['without_subtype']} without subtype"
+        "[Employees] Tutor subtype stats: %s with subtype, %s without subtype",
+        subtype_stats["with_subtype"],
+        subtype_stats["without_subtype"],
     )
 
     # Update employees in DB
     updated_count = 0
     not_found_count = 0
     async with get_stp_session() as session:
+        db_employees = await find_employees_by_fullnames(session, tutors_dict)
         for fullname, tutor_info in tutors_dict.items():
-            db_emp = await find_employee_by_fullname(session, fullname)
+            db_emp = db_employees.get(fullname)
 
             if db_emp:
                 emp_id = tutor_info["employee_id"]
@@ -351,21 +380,23 @@ async def update_tutor_info(tutors_api: TutorsAPI) -> int:
                 db_emp.tutor_subtype = tutor_info["tutor_subtype"]
 
                 logger.debug(
-                    f"[Employees] Updated tutor {fullname}: "
-                    f"subtype={tutor_info['tutor_subtype']}, "
-                    f"type={tutor_info['tutor_type']}, "
-                    f"employee_id={tutor_info['employee_id']}"
+                    "[Employees] Updated tutor %s: subtype=%s, type=%s, employee_id=%s",
+                    fullname,
+                    tutor_info["tutor_subtype"],
+                    tutor_info["tutor_type"],
+                    tutor_info["employee_id"],
                 )
                 updated_count += 1
             else:
                 not_found_count += 1
-                logger.debug(f"[Employees] Employee not found in DB: {fullname}")
+                logger.debug("[Employees] Employee not found in DB: %s", fullname)
 
         await session.commit()
 
     logger.info(
-        f"[Employees] Updated {updated_count} tutor records "
-        f"({not_found_count} tutors not found in DB)"
+        "[Employees] Updated %s tutor records (%s tutors not found in DB)",
+        updated_count,
+        not_found_count,
     )
     return updated_count
 
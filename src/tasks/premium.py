@@ -1,15 +1,20 @@
 import asyncio
 import logging
+from collections.abc import Callable, Iterable, Iterator
 from datetime import date as datetime_date
 from datetime import datetime
+from operator import attrgetter
+from typing import Any
 
 from okc_py import PremiumAPI
 from okc_py.api.models.premium import HeadPremiumData, SpecialistPremiumData
-from sqlalchemy import delete
+from sqlalchemy import delete, or_
 from stp_database.models.Stats import HeadPremium, SpecPremium
 
 from src.core.db import get_stats_session
+from src.services.constants import head_unites, unites
 from src.tasks.base import (
+    BatchDBOperator,
     ConcurrentAPIFetcher,
     PeriodHelper,
     log_processing_time,
@@ -32,133 +37,177 @@ def get_recent_periods(months: int = 6) -> list[str]:
     return periods
 
 
-def map_premium_row(
-    row: SpecialistPremiumData | HeadPremiumData, is_head: bool
-) -> SpecPremium | HeadPremium:
-    """Map Pydantic model to DB model."""
-    premium = (HeadPremium if is_head else SpecPremium)()
-    premium.extraction_period = datetime.strptime(row.period, "%d.%m.%Y")
-    premium.employee_id = row.employee_id
-
-    # Common fields: GOK
-    premium.gok = row.gok
-    premium.gok_normative = row.gok_normative
-    premium.gok_pers_normative = row.gok_pers_normative
-    premium.gok_normative_rate = row.gok_normative_rate
-    premium.gok_premium = row.gok_premium
-
-    # Common fields: total premium
-    premium.total_premium = row.total_premium
-
-    if is_head:
-        # FLR fields for heads
-        premium.flr = row.flr
-        premium.flr_normative = row.flr_normative
-        premium.flr_pers_normative = row.flr_pers_normative
-        premium.flr_normative_rate = row.flr_normative_rate
-        premium.flr_premium = row.flr_premium
-
-        # AHT fields for heads
-        premium.aht = row.aht
-        premium.aht_normative = row.aht_normative
-        premium.aht_pers_normative = row.aht_pers_normative
-        premium.aht_normative_rate = row.aht_normative_rate
-        premium.aht_premium = row.aht_premium
-    else:
-        # Contacts count for specialists
-        premium.contacts_count = row.total_chats
-
-        # CSAT fields for specialists
-        premium.csat = row.csat
-        premium.csat_normative = row.csat_normative
-        premium.csat_pers_normative = row.csat_pers_normative
-        premium.csat_normative_rate = row.csat_normative_rate
-        premium.csat_premium = row.csat_premium
-
-        # AHT fields for specialists
-        premium.aht = row.aht
-        premium.aht_normative = row.aht_normative
-        premium.aht_pers_normative = row.aht_pers_normative
-        premium.aht_normative_rate = row.aht_normative_rate
-        premium.aht_premium = row.aht_premium
+# Every premium metric is stored as value, normative, personal normative,
+# normative rate and premium columns sharing the metric name as prefix
+METRIC_SUFFIXES = ("", "_normative", "_pers_normative", "_normative_rate", "_premium")
 
-    return premium
 
+def premium_fields(*metrics: str, **mapping: str) -> tuple[tuple[str, str], ...]:
+    """Build (column, row_attr) pairs for metric columns, then mapped ones."""
+    common = ("employee_id", "total_premium")
+    metric_columns = tuple(m + suffix for m in metrics for suffix in METRIC_SUFFIXES)
+    return tuple((c, c) for c in common + metric_columns) + tuple(mapping.items())
 
-async def fill_premium(
-    api: PremiumAPI,
-    divisions: list[str],
-    periods: list[str],
-    is_head: bool,
-) -> int:
-    """Fill premium data."""
-    premium_type = "Head" if is_head else "Specialist"
-    logger.info(
-        f"[{premium_type} Premium] Starting premium data update for {len(periods)} periods x {len(divisions)} divisions"
+
+# Column mapping per premium table, keyed by is_head
+PREMIUM_FIELDS = {
+    True: premium_fields("gok", "flr", "aht"),
+    False: premium_fields("gok", "csat", "aht", contacts_count="total_chats"),
+}
+# Column names and a C-level getter reading all row attributes in one call
+PREMIUM_ROW_BUILDERS = {
+    is_head: (
+        tuple(column for column, _ in fields),
+        attrgetter(*(row_attr for _, row_attr in fields)),
     )
+    for is_head, fields in PREMIUM_FIELDS.items()
+}
 
-    async def fetch(period: str, division: str):
-        if is_head:
-            return await api.get_head_premium(period, division)
-        return await api.get_specialist_premium(period, division)
 
-    tasks = [(p, d) for p in periods for d in divisions]
-    logger.info(f"[{premium_type} Premium] Fetching data for {len(tasks)} API calls")
+def map_premium_row(
+    row: SpecialistPremiumData | HeadPremiumData,
+    is_head: bool,
+    extraction_period: datetime,
+) -> dict[str, Any]:
+    """Map Pydantic model to insert-ready DB row."""
+    columns, getter = PREMIUM_ROW_BUILDERS[is_head]
+    premium = dict(zip(columns, getter(row), strict=True))
+    premium["extraction_period"] = extraction_period
+    return premium
+
+
+def premium_tasks(
+    api: PremiumAPI, divisions: list[str], periods: list[str], is_head: bool
+) -> list[tuple[bool, Callable, str, str]]:
+    """Build (is_head, endpoint, period, division) fetch tasks."""
+    endpoint = api.get_head_premium if is_head else api.get_specialist_premium
+    return [(is_head, endpoint, p, d) for p in periods for d in divisions]
+
+
+async def fetch_premium(
+    tasks: list[tuple[bool, Callable, str, str]],
+) -> list[tuple[tuple[bool, Callable, str, str], Any]]:
+    """Fetch head and specialist premium tasks in one concurrent fan-out."""
+
+    async def fetch(_is_head: bool, endpoint: Callable, period: str, division: str):
+        return await endpoint(period, division)
 
     fetcher = ConcurrentAPIFetcher(semaphore_limit=15)
-    results = await fetcher.fetch_parallel(tasks, fetch)
+    return await fetcher.fetch_parallel(tasks, fetch)
+
 
-    premium_objects = []
-    for (_period, _division), result in results:
-        if result is None:
+def iter_premium_rows(
+    results: list[tuple[tuple[bool, Callable, str, str], Any]],
+    is_head: bool,
+    period_dates: dict[str, datetime],
+) -> Iterator[dict[str, Any]]:
+    """Yield insert-ready premium rows, skipping rows without employee_id."""
+    for (task_is_head, _endpoint, period, _division), result in results:
+        if result is None or task_is_head is not is_head:
             continue
 
+        extraction_period = period_dates[period]
         items = result.premium if is_head else result.items
         for row in items:
-            premium = map_premium_row(row, is_head)
-            if premium.employee_id:
-                premium_objects.append(premium)
+            premium = map_premium_row(row, is_head, extraction_period)
+            if premium["employee_id"]:
+                yield premium
 
-    if not premium_objects:
-        logger.warning(f"[{premium_type} Premium] No premium data retrieved from API")
-        return 0
 
-    logger.info(
-        f"[{premium_type} Premium] Mapped {len(premium_objects)} premium records"
-    )
+async def save_premium_rows(
+    rows: Iterable[dict[str, Any]], periods: set[datetime], is_head: bool
+) -> int:
+    """Replace premium data of given periods with rows, streamed in batches."""
+    premium_type = "Head" if is_head else "Specialist"
+    model = HeadPremium if is_head else SpecPremium
 
     async with get_stats_session() as session:
-        model = HeadPremium if is_head else SpecPremium
         logger.info(
-            f"[{premium_type} Premium] Deleting old data and inserting new records"
+            "[%s Premium] Deleting old data and inserting new records", premium_type
         )
 
-        # Delete rows where employee_id is None and old period data
-        await session.execute(delete(model).where(model.employee_id.is_(None)))
-        unique_periods = {p.extraction_period for p in premium_objects}
-        for _period in unique_periods:
+        # Delete rows where employee_id is None and old period data in one statement
+        async def delete_old_data():
             await session.execute(
-                delete(model).where(model.extraction_period == _period)
+                delete(model).where(
+                    or_(
+                        model.employee_id.is_(None),
+                        model.extraction_period.in_(periods),
+                    )
+                )
             )
 
-        session.add_all(premium_objects)
-        await session.commit()
+        db_operator = BatchDBOperator(session)
+        return await db_operator.bulk_insert_with_cleanup(
+            model=model,
+            data_list=rows,
+            delete_func=delete_old_data,
+            operation_name=f"{premium_type} Premium",
+            raise_on_error=True,
+        )
+
+
+async def save_fetched_premium(
+    results: list[tuple[tuple[bool, Callable, str, str], Any]],
+    periods: list[str],
+    is_head: bool,
+) -> int:
+    """Save fetched premium results of one table, replacing their periods."""
+    premium_type = "Head" if is_head else "Specialist"
+
+    # Every row of a response belongs to the requested period, parse it once
+    period_dates = {p: datetime.strptime(p, "%d.%m.%Y") for p in periods}
+    # Only clean periods iter_premium_rows will insert rows for, i.e. periods
+    # with at least one row carrying an employee_id
+    fetched_periods = {
+        period_dates[period]
+        for (task_is_head, _endpoint, period, _division), result in results
+        if task_is_head is is_head
+        and result is not None
+        and any(
+            row.employee_id for row in (result.premium if is_head else result.items)
+        )
+    }
+    if not fetched_periods:
+        logger.warning("[%s Premium] No premium data retrieved from API", premium_type)
+        return 0
+
+    count = await save_premium_rows(
+        iter_premium_rows(results, is_head, period_dates), fetched_periods, is_head
+    )
+    logger.info("[%s Premium] Completed: %s records saved", premium_type, count)
+    return count
 
+
+async def fill_premium(
+    api: PremiumAPI,
+    divisions: list[str],
+    periods: list[str],
+    is_head: bool,
+) -> int:
+    """Fill premium data."""
+    premium_type = "Head" if is_head else "Specialist"
     logger.info(
-        f"[{premium_type} Premium] Completed: {len(premium_objects)} records saved"
+        "[%s Premium] Starting premium data update for %s periods x %s divisions",
+        premium_type,
+        len(periods),
+        len(divisions),
     )
-    return len(premium_objects)
+
+    tasks = premium_tasks(api, divisions, periods, is_head)
+    logger.info("[%s Premium] Fetching data for %s API calls", premium_type, len(tasks))
+
+    results = await fetch_premium(tasks)
+    return await save_fetched_premium(results, periods, is_head)
 
 
 @log_processing_time("Specialist Premium data processing")
 async def fill_specialists_premium(api: PremiumAPI, period: str | None = None) -> int:
     """Fill specialist premium data."""
-    from src.services.constants import unites
-
     periods = [period] if period else get_recent_periods(2)
-    logger.info(f"Starting specialist premium update for periods: {periods}")
+    logger.info("Starting specialist premium update for periods: %s", periods)
     count = await fill_premium(api, unites, periods, is_head=False)
-    logger.info(f"Specialist premium update completed: {count} records")
+    logger.info("Specialist premium update completed: %s records", count)
     return count
 
 
@@ -166,9 +215,9 @@ async def fill_specialists_premium(api: PremiumAPI, period: str | None = None) -
 async def fill_heads_premium(api: PremiumAPI, period: str | None = None) -> int:
     """Fill head premium data."""
     periods = [period] if period else get_recent_periods(2)
-    logger.info(f"Starting head premium update for periods: {periods}")
-    count = await fill_premium(api, ["НТП", "НЦК"], periods, is_head=True)
-    logger.info(f"Head premium update completed: {count} records")
+    logger.info("Starting head premium update for periods: %s", periods)
+    count = await fill_premium(api, head_unites, periods, is_head=True)
+    logger.info("Head premium update completed: %s records", count)
     return count
 
 
@@ -177,11 +226,28 @@ async def fill_all_premium_last_6_months(api: PremiumAPI) -> None:
     """Fill all premium data for last 6 months."""
     periods = get_recent_periods(6)
     logger.info(
-        f"Starting full premium update for last 6 months: {len(periods)} periods"
+        "Starting full premium update for last 6 months: %s periods", len(periods)
+    )
+    # One fan-out over both tables so head and specialist requests overlap
+    tasks = premium_tasks(api, head_unites, periods, True) + premium_tasks(
+        api, unites, periods, False
     )
-    results = await asyncio.gather(
-        fill_premium(api, ["НТП", "НЦК"], periods, is_head=True),
-        fill_premium(api, ["НТП", "НЦК"], periods, is_head=False),
+    logger.info("Fetching premium data for %s API calls", len(tasks))
+    results = await fetch_premium(tasks)
+
+    # Saves run in separate transactions, a failed one must not cancel the other
+    saves = await asyncio.gather(
+        save_fetched_premium(results, periods, is_head=True),
+        save_fetched_premium(results, periods, is_head=False),
+        return_exceptions=True,
     )
-    total = sum(results)
-    logger.info(f"Full premium update completed: {total} total records")
+    errors = []
+    for premium_type, save in zip(("Head", "Specialist"), saves, strict=True):
+        if isinstance(save, BaseException):
+            logger.error("[%s Premium] Save failed: %s", premium_type, save)
+            errors.append(save)
+    if errors:
+        raise errors[0]
+
+    total = sum(saves)
+    logger.info("Full premium update completed: %s total records", total)
@@ -7,7 +7,7 @@ from sqlalchemy import delete
 from stp_database.models.Stats.sl import SL
 
 from src.core.db import get_stats_session
-from src.tasks.base import ConcurrentAPIFetcher, log_processing_time
+from src.tasks.base import BatchDBOperator, ConcurrentAPIFetcher, log_processing_time
 
 logger = logging.getLogger(__name__)
 
@@ -19,27 +19,29 @@ def get_default_periods() -> list[tuple[str, str]]:
     return [(yesterday.strftime("%d.%m.%Y"), today.strftime("%d.%m.%Y"))]
 
 
-def create_sl_object(result: Any, extraction_date: datetime) -> SL | None:
-    """Create SL object from API result."""
+def create_sl_object(result: Any, extraction_date: datetime) -> dict[str, Any] | None:
+    """Create insert-ready SL row from API result."""
     if not result or not result.total_data:
         return None
 
-    sl = SL()
-    sl.extraction_period = extraction_date
     td = result.total_data
-
-    sl.received_contacts = td.total_entered
-    sl.accepted_contacts = td.total_answered
-    sl.missed_contacts = td.total_abandoned
-    sl.sl_contacts = td.answered_in_sl
-    sl.accepted_contacts_percent = td.answered_percent
+    sl = {
+        "extraction_period": extraction_date,
+        "received_contacts": td.total_entered,
+        "accepted_contacts": td.total_answered,
+        "missed_contacts": td.total_abandoned,
+        "sl_contacts": td.answered_in_sl,
+        "accepted_contacts_percent": td.answered_percent,
+    }
 
     if result.detail_data.data:
         first_row = result.detail_data.data[0]
-        sl.sl = first_row.sl
-        sl.average_proc_time = first_row.average_release_time
+        sl["sl"] = first_row.sl
+        sl["average_proc_time"] = first_row.average_release_time
         if td.total_entered > 0:
-            sl.missed_contacts_percent = (td.total_abandoned / td.total_entered) * 100
+            sl["missed_contacts_percent"] = (
+                td.total_abandoned / td.total_entered
+            ) * 100
 
     return sl
 
@@ -56,7 +58,7 @@ async def fill_sl(
     if units is None:
         units = [7]
 
-    logger.info(f"[SL] Processing {len(periods)} periods with units: {units}")
+    logger.info("[SL] Processing %s periods with units: %s", len(periods), units)
 
     # Get queues
     logger.info("[SL] Fetching queue list from API")
@@ -65,7 +67,7 @@ async def fill_sl(
         logger.error("[SL] Failed to get queue list from API")
         raise ValueError("Failed to get queue list")
     queues = [vq for queue in queues_result.ntp_nck.queues for vq in queue.vqList]
-    logger.info(f"[SL] Retrieved {len(queues)} queues")
+    logger.info("[SL] Retrieved %s queues", len(queues))
 
     # Fetch all periods
     async def fetch(start_date: str, stop_date: str):
@@ -73,38 +75,49 @@ async def fill_sl(
             start_date=start_date, stop_date=stop_date, units=units, queues=queues
         )
 
-    logger.info(f"[SL] Fetching SL data for {len(periods)} periods")
+    logger.info("[SL] Fetching SL data for %s periods", len(periods))
     fetcher = ConcurrentAPIFetcher(semaphore_limit=5)
     results = await fetcher.fetch_parallel(periods, fetch)
 
-    # Create SL objects using helper
-    sl_objects = []
+    # Create SL rows using helper
+    sl_rows = []
     for (start, _), result in results:
         if result is None:
-            logger.warning(f"[SL] No data for period starting {start}")
+            logger.warning("[SL] No data for period starting %s", start)
             continue
 
         extraction_date = datetime.strptime(start, "%d.%m.%Y")
         sl = create_sl_object(result, extraction_date)
         if sl:
-            sl_objects.append(sl)
+            sl_rows.append(sl)
 
-    if not sl_objects:
+    if not sl_rows:
         logger.warning("[SL] No SL data to save")
         return 0
 
-    logger.info(f"[SL] Mapped {len(sl_objects)} SL records")
+    logger.info("[SL] Mapped %s SL records", len(sl_rows))
+
+    unique_periods = {sl["extraction_period"] for sl in sl_rows}
 
     async with get_stats_session() as session:
         logger.info("[SL] Deleting old SL data and inserting new records")
-        unique_periods = {sl.extraction_period for sl in sl_objects}
-        for period in unique_periods:
-            await session.execute(delete(SL).where(SL.extraction_period == period))
-        session.add_all(sl_objects)
-        await session.commit()
-
-    logger.info(f"[SL] Completed: {len(sl_objects)} records saved")
-    return len(sl_objects)
+
+        async def delete_old_data():
+            await session.execute(
+                delete(SL).where(SL.extraction_period.in_(unique_periods))
+            )
+
+        db_operator = BatchDBOperator(session)
+        count = await db_operator.bulk_insert_with_cleanup(
+            model=SL,
+            data_list=sl_rows,
+            delete_func=delete_old_data,
+            operation_name="SL",
+            raise_on_error=True,
+        )
+
+    logger.info("[SL] Completed: %s records saved", count)
+    return count
 
 
 @log_processing_time("SL data processing for specific periods")
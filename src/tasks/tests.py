@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime
+from typing import Any
 
 from okc_py import TestsAPI
 from okc_py.api.models.tests import AssignedTest as APIAssignedTest
@@ -7,7 +8,7 @@ from sqlalchemy import delete
 from stp_database.models.Stats import AssignedTest
 
 from src.core.db import get_stats_session
-from src.tasks.base import PeriodHelper, log_processing_time
+from src.tasks.base import BatchDBOperator, PeriodHelper, log_processing_time
 
 logger = logging.getLogger(__name__)
 
@@ -45,32 +46,39 @@ async def fetch_assigned_tests(
 
 def create_db_test(
     api_test: APIAssignedTest, extraction_period: datetime
-) -> AssignedTest:
-    """Create SQLAlchemy model from Pydantic API model."""
-    return AssignedTest(
-        test_id=int(api_test.id),
-        test_name=api_test.test_name,
-        employee_fullname=api_test.user_name,
-        head_fullname=api_test.head_name,
-        creator_fullname=api_test.creator_name,
-        status=api_test.status_name,
-        active_from=parse_active_from(api_test.active_from),
-        extraction_period=extraction_period,
-        created_at=datetime.now(),
-    )
-
-
-async def save_assigned_tests(tests: list[AssignedTest]) -> int:
+) -> dict[str, Any]:
+    """Create insert-ready DB row from Pydantic API model."""
+    return {
+        "test_id": int(api_test.id),
+        "test_name": api_test.test_name,
+        "employee_fullname": api_test.user_name,
+        "head_fullname": api_test.head_name,
+        "creator_fullname": api_test.creator_name,
+        "status": api_test.status_name,
+        "active_from": parse_active_from(api_test.active_from),
+        "extraction_period": extraction_period,
+        "created_at": datetime.now(),
+    }
+
+
+async def save_assigned_tests(tests: list[dict[str, Any]]) -> int:
     """Save assigned tests to database with optimized cleanup."""
     if not tests:
         return 0
 
     async with get_stats_session() as session:
-        await session.execute(delete(AssignedTest))
-        session.add_all(tests)
-        await session.commit()
 
-    return len(tests)
+        async def delete_old_data():
+            await session.execute(delete(AssignedTest))
+
+        db_operator = BatchDBOperator(session)
+        return await db_operator.bulk_insert_with_cleanup(
+            model=AssignedTest,
+            data_list=tests,
+            delete_func=delete_old_data,
+            operation_name="Assigned Tests",
+            raise_on_error=True,
+        )
 
 
 @log_processing_time("Assigned Tests data processing")
@@ -83,7 +91,7 @@ async def fill_assigned_tests(
     if start_date is None or stop_date is None:
         start_date, stop_date = get_default_date_range()
 
-    logger.info(f"[Tests] Fetching assigned tests from {start_date} to {stop_date}")
+    logger.info("[Tests] Fetching assigned tests from %s to %s", start_date, stop_date)
 
     # Fetch
     api_tests = await fetch_assigned_tests(api, start_date, stop_date)
@@ -92,15 +100,15 @@ async def fill_assigned_tests(
         logger.warning("[Tests] No assigned tests data received from API")
         return 0
 
-    logger.info(f"[Tests] Retrieved {len(api_tests)} assigned tests from API")
+    logger.info("[Tests] Retrieved %s assigned tests from API", len(api_tests))
 
-    # Map API models to DB models
+    # Map API models to DB rows
     extraction_period = datetime.strptime(stop_date, "%d.%m.%Y")
     db_tests = [create_db_test(test, extraction_period) for test in api_tests]
 
     # Save
     count = await save_assigned_tests(db_tests)
-    logger.info(f"[Tests] Completed: {count} records saved")
+    logger.info("[Tests] Completed: %s records saved", count)
     return count
 
 
@@ -109,5 +117,5 @@ async def fill_all_tests_data(api: TestsAPI) -> int:
     """Main function for filling all tests data."""
     logger.info("[Tests] Starting full assigned tests data update")
     count = await fill_assigned_tests(api)
-    logger.info(f"[Tests] Full update completed: {count} records")
+    logger.info("[Tests] Full update completed: %s records", count)
     return count
@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime, timedelta
+from typing import Any
 
 from okc_py import TutorsAPI
 from okc_py.api.models.tutors import ShiftPart, Trainee, Tutor
@@ -7,7 +8,7 @@ from sqlalchemy import delete
 from stp_database.models.Stats import TutorsSchedule
 
 from src.core.db import get_stats_session
-from src.tasks.base import log_processing_time
+from src.tasks.base import BatchDBOperator, ConcurrentAPIFetcher, log_processing_time
 
 logger = logging.getLogger(__name__)
 
@@ -44,25 +45,26 @@ def extract_trainee_data(
     shift_day: str,
     shift_parts: list[ShiftPart],
     extraction_period: datetime,
-) -> list[TutorsSchedule]:
+) -> list[dict[str, Any]]:
     """Extract trainee data from tutor graph - direct from Pydantic models."""
     training_day = datetime.strptime(shift_day, "%d.%m.%Y")
 
-    schedule = TutorsSchedule()
-    schedule.extraction_period = extraction_period
-    schedule.training_day = training_day
-    schedule.training_start_time = parse_time_to_datetime(
-        training_day, shift_parts[0].start if shift_parts else None, "00:00"
-    )
-    schedule.training_end_time = parse_time_to_datetime(
-        training_day, shift_parts[-1].end if shift_parts else None, "23:59"
-    )
-    schedule.tutor_fullname = tutor.tutor_info.full_name
-    schedule.tutor_employee_id = tutor.tutor_info.employee_id
-    schedule.tutor_division = tutor.tutor_info.unit
-    schedule.trainee_fullname = trainee.full_name
-    schedule.trainee_employee_id = trainee.employee_id
-    schedule.trainee_type = trainee.trainee_type
+    schedule = {
+        "extraction_period": extraction_period,
+        "training_day": training_day,
+        "training_start_time": parse_time_to_datetime(
+            training_day, shift_parts[0].start if shift_parts else None, "00:00"
+        ),
+        "training_end_time": parse_time_to_datetime(
+            training_day, shift_parts[-1].end if shift_parts else None, "23:59"
+        ),
+        "tutor_fullname": tutor.tutor_info.full_name,
+        "tutor_employee_id": tutor.tutor_info.employee_id,
+        "tutor_division": tutor.tutor_info.unit,
+        "trainee_fullname": trainee.full_name,
+        "trainee_employee_id": trainee.employee_id,
+        "trainee_type": trainee.trainee_type,
+    }
 
     return [schedule]
 
@@ -87,16 +89,16 @@ async def fetch_tutor_graph(
 async def process_tutor_period(
     api: TutorsAPI,
     period: tuple[str, str],
-) -> list[TutorsSchedule]:
+) -> list[dict[str, Any]]:
     """Process one period of tutor data."""
     start_date, stop_date = period
     extraction_date = datetime.strptime(start_date, "%d.%m.%Y")
 
-    logger.debug(f"[Tutors] Processing period: {start_date} - {stop_date}")
+    logger.debug("[Tutors] Processing period: %s - %s", start_date, stop_date)
 
     tutors_graph = await fetch_tutor_graph(api, start_date, stop_date)
     if not tutors_graph:
-        logger.warning(f"[Tutors] No tutor data for period: {start_date}")
+        logger.warning("[Tutors] No tutor data for period: %s", start_date)
         return []
 
     schedules = []
@@ -115,31 +117,40 @@ async def process_tutor_period(
                     )
                 )
 
-    logger.debug(f"[Tutors] Generated {len(schedules)} schedules for {start_date}")
+    logger.debug("[Tutors] Generated %s schedules for %s", len(schedules), start_date)
     return schedules
 
 
-async def save_tutor_schedules(schedules: list[TutorsSchedule]) -> int:
+async def save_tutor_schedules(schedules: list[dict[str, Any]]) -> int:
     """Save tutor schedules to database with optimized cleanup."""
     if not schedules:
         logger.warning("[Tutors] No schedules to save")
         return 0
 
-    logger.info(f"[Tutors] Saving {len(schedules)} tutor schedules")
+    logger.info("[Tutors] Saving %s tutor schedules", len(schedules))
 
     async with get_stats_session() as session:
-        periods_to_delete = {s.extraction_period for s in schedules}
-        logger.info(f"[Tutors] Deleting old data for {len(periods_to_delete)} periods")
-        for period in periods_to_delete:
+        periods_to_delete = {s["extraction_period"] for s in schedules}
+        logger.info("[Tutors] Deleting old data for %s periods", len(periods_to_delete))
+
+        async def delete_old_data():
             await session.execute(
-                delete(TutorsSchedule).where(TutorsSchedule.extraction_period == period)
+                delete(TutorsSchedule).where(
+                    TutorsSchedule.extraction_period.in_(periods_to_delete)
+                )
             )
 
-        session.add_all(schedules)
-        await session.commit()
+        db_operator = BatchDBOperator(session)
+        count = await db_operator.bulk_insert_with_cleanup(
+            model=TutorsSchedule,
+            data_list=schedules,
+            delete_func=delete_old_data,
+            operation_name="Tutors",
+            raise_on_error=True,
+        )
 
-    logger.info(f"[Tutors] Successfully saved {len(schedules)} schedules")
-    return len(schedules)
+    logger.info("[Tutors] Successfully saved %s schedules", count)
+    return count
 
 
 @log_processing_time("Tutor Schedule data processing")
@@ -153,20 +164,23 @@ async def fill_tutor_schedule(
         months = 6 if full_update else 2
         periods = generate_periods(months)
 
-    logger.info(f"[Tutors] Starting tutor schedule update for {len(periods)} periods")
+    logger.info("[Tutors] Starting tutor schedule update for %s periods", len(periods))
 
-    # Process all periods
+    # Process all periods concurrently, failed periods are skipped
+    fetcher = ConcurrentAPIFetcher(semaphore_limit=10)
+    results = await fetcher.fetch_parallel(
+        [(api, period) for period in periods], process_tutor_period
+    )
     all_schedules = []
-    for i, period in enumerate(periods, 1):
-        logger.debug(f"[Tutors] Processing period {i}/{len(periods)}")
-        schedules = await process_tutor_period(api, period)
-        all_schedules.extend(schedules)
+    for _, schedules in results:
+        if schedules:
+            all_schedules.extend(schedules)
 
-    logger.info(f"[Tutors] Total schedules generated: {len(all_schedules)}")
+    logger.info("[Tutors] Total schedules generated: %s", len(all_schedules))
 
     # Save
     count = await save_tutor_schedules(all_schedules)
-    logger.info(f"[Tutors] Tutor schedule update completed: {count} records")
+    logger.info("[Tutors] Tutor schedule update completed: %s records", count)
     return count
 
 
@@ -175,7 +189,9 @@ async def fill_tutor_schedule_for_periods(
     periods: list[tuple[str, str]],
 ) -> int:
     """Fill tutor schedule for specific periods."""
-    logger.info(f"[Tutors] Filling tutor schedules for {len(periods)} specific periods")
+    logger.info(
+        "[Tutors] Filling tutor schedules for %s specific periods", len(periods)
+    )
     count = await fill_tutor_schedule(api, periods=periods)
-    logger.info(f"[Tutors] Completed specific periods update: {count} records")
+    logger.info("[Tutors] Completed specific periods update: %s records", count)
     return count
@@ -1,6 +1,8 @@
 import asyncio
 import logging
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Any
 
 from okc_py import UreAPI
@@ -17,6 +19,7 @@ from okc_py.api.models.ure import (
     SalesPotentialDataRecord,
 )
 from okc_py.api.repos.thanks import ThanksAPI
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy import and_, delete, func, select
 from stp_database.models.Questions.question import Question
 from stp_database.models.STP.employee import Employee
@@ -28,7 +31,12 @@ from src.services.helpers import (
     get_week_start_date,
     get_yesterday_date,
 )
-from src.tasks.base import BatchDBOperator, ConcurrentAPIFetcher, log_processing_time
+from src.tasks.base import (
+    BatchDBOperator,
+    ConcurrentAPIFetcher,
+    PeriodHelper,
+    log_processing_time,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -43,11 +51,16 @@ REPORT_TYPES = {
     "PaidService": PaidServiceRecord,
     "CSAT": CSATDataRecord,
 }
-# Field mapping configuration for each report type
-FIELD_MAPPERS = {
-    "AHT": lambda kpi, r: setattr_kpi(
-        kpi,
-        r,
+
+
+def field_pairs(*attrs: str, **mapping: str) -> tuple[tuple[str, str], ...]:
+    """Build (kpi_attr, record_attr) pairs, same-named attrs first, then mapped ones."""
+    return tuple((attr, attr) for attr in attrs) + tuple(mapping.items())
+
+
+# Field mapping configuration for each report type, resolved once at import
+FIELD_MAPPINGS = {
+    "AHT": field_pairs(
         "aht",
         "aht_chats_web",
         "aht_chats_mobile",
@@ -57,20 +70,16 @@ FIELD_MAPPERS = {
         "aht_chats_viber",
         contacts_count="aht_total_contacts",
     ),
-    "FLR": lambda kpi, r: setattr_kpi(
-        kpi,
-        r,
+    "FLR": field_pairs(
         "flr",
         "flr_services",
         flr_services_cross="flr_services_cross",
         flr_services_transfer="flr_services_transfers",
     ),
-    "CSI": lambda kpi, r: setattr_kpi(kpi, r, "csi"),
-    "POK": lambda kpi, r: setattr_kpi(kpi, r, "pok", "pok_rated_contacts"),
-    "DELAY": lambda kpi, r: setattr_kpi(kpi, r, "delay"),
-    "Sales": lambda kpi, r: setattr_kpi(
-        kpi,
-        r,
+    "CSI": field_pairs("csi"),
+    "POK": field_pairs("pok", "pok_rated_contacts"),
+    "DELAY": field_pairs("delay"),
+    "Sales": field_pairs(
         "sales",
         "sales_videos",
         "sales_routers",
@@ -78,9 +87,7 @@ FIELD_MAPPERS = {
         "sales_intercoms",
         "sales_conversion",
     ),
-    "SalesPotential": lambda kpi, r: setattr_kpi(
-        kpi,
-        r,
+    "SalesPotential": field_pairs(
         "sales_potential",
         "sales_potential_video",
         "sales_potential_routers",
@@ -88,21 +95,51 @@ FIELD_MAPPERS = {
         "sales_potential_intercoms",
         "sales_potential_conversion",
     ),
-    "PaidService": lambda kpi, r: setattr_kpi(
-        kpi, r, "services", "services_remote", "services_onsite", "services_conversion"
+    "PaidService": field_pairs(
+        "services", "services_remote", "services_onsite", "services_conversion"
     ),
-    "CSAT": lambda kpi, r: setattr_kpi(
-        kpi, r, "csat", csat_rated="total_rated", csat_high_rated="total_high_rated"
+    "CSAT": field_pairs(
+        "csat", csat_rated="total_rated", csat_high_rated="total_high_rated"
     ),
 }
 
 
-def setattr_kpi(kpi_obj: Any, record: Any, *attrs: str, **mapping: str) -> None:
-    """Set attributes on KPI object from record with optional field name mapping."""
-    for attr in attrs:
-        setattr(kpi_obj, attr, getattr(record, attr, None))
-    for kpi_attr, record_attr in mapping.items():
-        setattr(kpi_obj, kpi_attr, getattr(record, record_attr, None))
+def fields_getter(fields: tuple[tuple[str, str], ...]) -> Callable[[Any], tuple]:
+    """Build a getter returning the record values of all field pairs as a tuple."""
+    getter = attrgetter(*(record_attr for _, record_attr in fields))
+    if len(fields) == 1:
+        return lambda record: (getter(record),)
+    return getter
+
+
+# Report type is the tag: one lookup per response selects the record class,
+# its list validator (a whole response is validated in one call), field pairs
+# and a C-level getter reading all of the record's values in one call
+REPORT_HANDLERS = {
+    report_type: (
+        record_class,
+        TypeAdapter(list[record_class]),
+        FIELD_MAPPINGS[report_type],
+        fields_getter(FIELD_MAPPINGS[report_type]),
+    )
+    for report_type, record_class in REPORT_TYPES.items()
+}
+
+
+def set_kpi_fields(
+    kpi_row: dict[str, Any],
+    record: Any,
+    fields: tuple[tuple[str, str], ...],
+    getter: Callable[[Any], tuple],
+) -> None:
+    """Copy record values into KPI row using precomputed field pairs."""
+    try:
+        values = getter(record)
+    except AttributeError:
+        # Record schema lacks some attributes, missing ones become None
+        values = [getattr(record, record_attr, None) for _, record_attr in fields]
+    for (kpi_attr, _), value in zip(fields, values, strict=True):
+        kpi_row[kpi_attr] = value
 
 
 def parse_employee_id(employee_id: Any) -> int | None:
@@ -111,25 +148,54 @@ def parse_employee_id(employee_id: Any) -> int | None:
         return None
 
     if isinstance(employee_id, int):
-        return employee_id if employee_id != 0 else None
+        return employee_id
 
     if isinstance(employee_id, str):
-        emp_id = employee_id.split("-")[0] if "-" in employee_id else employee_id
         try:
-            return int(emp_id) if int(emp_id) != 0 else None
+            return int(employee_id.partition("-")[0]) or None
         except ValueError:
             return None
 
     return None
 
 
+def validate_records(
+    record_class: type, adapter: TypeAdapter, items: list[Any]
+) -> list[Any]:
+    """Validate all rows of a report at once, skipping invalid rows on failure."""
+    try:
+        return adapter.validate_python(items)
+    except ValidationError:
+        pass
+
+    records = []
+    for item in items:
+        try:
+            records.append(record_class.model_validate(item))
+        except ValidationError:
+            continue
+    return records
+
+
+def get_period_bounds(
+    model_class: type, period_date: datetime
+) -> tuple[datetime, datetime]:
+    """Get [start, end) boundaries of the KPI period that period_date belongs to."""
+    period_start = period_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    if model_class is SpecWeekKPI:
+        return period_start, period_start + timedelta(days=7)
+    if model_class is SpecMonthKPI:
+        period_start = period_start.replace(day=1)
+        return period_start, PeriodHelper.add_months(period_start, 1)
+    return period_start, period_start + timedelta(days=1)
+
+
 def aggregate_kpi_data(
     api_results: list[tuple],
-    model_class: type,
     extraction_period: datetime,
-    thanks_results: list[tuple[int, Any]] = None,
-) -> list:
-    """Aggregate KPI data by employee_id."""
+    thanks_results: list[tuple[tuple[int], Any]] = None,
+) -> list[dict[str, Any]]:
+    """Aggregate KPI data by employee_id into insert-ready rows."""
     kpi_by_employee_id = {}
 
     # Process standard KPI reports
@@ -137,32 +203,24 @@ def aggregate_kpi_data(
         if not api_result or not hasattr(api_result, "data"):
             continue
 
-        record_class = REPORT_TYPES.get(report_type)
-        mapper = FIELD_MAPPERS.get(report_type)
-        if not record_class or not mapper:
+        handler = REPORT_HANDLERS.get(report_type)
+        if handler is None:
             continue
 
-        for item in api_result.data:
-            try:
-                record = (
-                    item
-                    if isinstance(item, record_class)
-                    else record_class.model_validate(item)
-                )
-            except Exception:
-                continue
-
+        record_class, adapter, fields, getter = handler
+        for record in validate_records(record_class, adapter, api_result.data):
             employee_id = parse_employee_id(record.id)
             if employee_id is None:
                 continue
 
-            if employee_id not in kpi_by_employee_id:
-                kpi_obj = model_class()
-                kpi_obj.employee_id = employee_id
-                kpi_obj.extraction_period = extraction_period
-                kpi_by_employee_id[employee_id] = kpi_obj
+            kpi = kpi_by_employee_id.get(employee_id)
+            if kpi is None:
+                kpi = kpi_by_employee_id[employee_id] = {
+                    "employee_id": employee_id,
+                    "extraction_period": extraction_period,
+                }
 
-            mapper(kpi_by_employee_id[employee_id], record)
+            set_kpi_fields(kpi, record, fields, getter)
 
     # Process thanks data
     if thanks_results:
@@ -183,18 +241,17 @@ def aggregate_kpi_data(
                 if employee_id is None or employee_id == 0:
                     continue
 
-                if employee_id not in kpi_by_employee_id:
-                    kpi_obj = model_class()
-                    kpi_obj.employee_id = employee_id
-                    kpi_obj.extraction_period = extraction_period
-                    kpi_by_employee_id[employee_id] = kpi_obj
+                kpi = kpi_by_employee_id.get(employee_id)
+                if kpi is None:
+                    kpi = kpi_by_employee_id[employee_id] = {
+                        "employee_id": employee_id,
+                        "extraction_period": extraction_period,
+                    }
 
-                current_thanks = (
-                    getattr(kpi_by_employee_id[employee_id], "thanks", 0) or 0
-                )
-                kpi_by_employee_id[employee_id].thanks = current_thanks + 1
+                kpi["thanks"] = kpi.get("thanks", 0) + 1
 
-    return [kpi for kpi in kpi_by_employee_id.values() if kpi.employee_id]
+    # Both loops skip falsy ids, so every row already has an employee_id
+    return list(kpi_by_employee_id.values())
 
 
 async def fetch_kpi_reports(
@@ -221,7 +278,7 @@ async def fetch_kpi_reports(
                 )
             return result
         except Exception as e:
-            logger.error(f"Error fetching {division}/{report_type}: {e}")
+            logger.error("Error fetching %s/%s: %s", division, report_type, e)
             return None
 
     tasks = [
@@ -229,11 +286,9 @@ async def fetch_kpi_reports(
         for division in divisions
         for report_type in report_types
     ]
+    # Failed reports stay as None, aggregation skips them in its single pass
     fetcher = ConcurrentAPIFetcher(semaphore_limit=15)
-    results = await fetcher.fetch_parallel(tasks, fetch_kpi)
-    return [
-        (task_params, result) for task_params, result in results if result is not None
-    ]
+    return await fetcher.fetch_parallel(tasks, fetch_kpi)
 
 
 async def fetch_thanks_reports(
@@ -261,38 +316,35 @@ async def fetch_thanks_reports(
                 data = []
 
             if data:
-                logger.info(f"Division {division}: fetched {len(data)} thanks records")
-            return (division, data)
+                logger.info(
+                    "Division %s: fetched %s thanks records", division, len(data)
+                )
+            return data
         except Exception as e:
-            logger.error(f"Error fetching thanks for division {division}: {e}")
-            return (division, [])
+            logger.error("Error fetching thanks for division %s: %s", division, e)
+            return []
 
+    # Empty results are kept, aggregation skips them in its single pass
     fetcher = ConcurrentAPIFetcher(semaphore_limit=10)
-    results = await fetcher.fetch_parallel(
+    return await fetcher.fetch_parallel(
         [(division,) for division in divisions], fetch_thanks
     )
-    return [
-        result for task_params, result in results if result is not None and result[1]
-    ]
 
 
-async def save_kpi_data(data: list, model_class: type) -> int:
+async def save_kpi_data(data: list[dict[str, Any]], model_class: type) -> int:
     """Save KPI data to database using BatchDBOperator."""
-
-    async def delete_old_data():
-        async with get_stats_session() as session:
-            await session.execute(
-                delete(model_class).where(model_class.employee_id.is_(None))
-            )
-            await session.execute(delete(model_class))
-            await session.commit()
-
     if not data:
         return 0
 
     async with get_stats_session() as session:
+        # Cleanup runs in the insert transaction, so readers never see an empty table.
+        # A full DELETE already covers rows with employee_id IS NULL.
+        async def delete_old_data():
+            await session.execute(delete(model_class))
+
         db_operator = BatchDBOperator(session)
         return await db_operator.bulk_insert_with_cleanup(
+            model=model_class,
             data_list=data,
             delete_func=delete_old_data,
             operation_name=f"{model_class.__name__} Update",
@@ -310,67 +362,55 @@ async def process_kpi(
     from src.services.constants import unites
 
     model_name = model_class.__name__
-    logger.info(f"[{model_name}] Processing KPI data for period: {extraction_period}")
-
-    report_types = [
-        "AHT",
-        "FLR",
-        "CSI",
-        "POK",
-        "DELAY",
-        "Sales",
-        "SalesPotential",
-        "PaidService",
-        "CSAT",
-    ]
     logger.info(
-        f"[{model_name}] Fetching {len(unites)} divisions x {len(report_types)} report types"
+        "[%s] Processing KPI data for period: %s", model_name, extraction_period
+    )
+
+    report_types = list(REPORT_HANDLERS)
+    logger.info(
+        "[%s] Fetching %s divisions x %s report types",
+        model_name,
+        len(unites),
+        len(report_types),
     )
 
     api_results = await fetch_kpi_reports(
         api, unites, report_types, start_date, use_week_period
     )
     logger.info(
-        f"[{model_name}] Fetched {len(api_results)} API results, aggregating data"
+        "[%s] Fetched %s/%s API requests, aggregating data",
+        model_name,
+        sum(result is not None for _, result in api_results),
+        len(api_results),
     )
 
     # Fetch thanks data
     thanks_unit_ids = list(api.unites.values())
 
-    if start_date:
-        if use_week_period:
-            end_date = start_date + timedelta(days=7)
-        elif model_name == "SpecMonthKPI":
-            if start_date.month == 12:
-                end_date = start_date.replace(year=start_date.year + 1, month=1, day=1)
-            else:
-                end_date = start_date.replace(month=start_date.month + 1, day=1)
-        else:
-            end_date = start_date + timedelta(days=1)
-        thanks_start = start_date.strftime("%d.%m.%Y")
-        thanks_end = end_date.strftime("%d.%m.%Y")
-    else:
-        yesterday = get_yesterday_date()
-        thanks_start = yesterday.strftime("%d.%m.%Y")
-        thanks_end = (yesterday + timedelta(days=1)).strftime("%d.%m.%Y")
+    period_start, period_end = get_period_bounds(
+        model_class, start_date or get_yesterday_date()
+    )
+    thanks_start = period_start.strftime("%d.%m.%Y")
+    thanks_end = period_end.strftime("%d.%m.%Y")
 
     logger.info(
-        f"[{model_name}] Fetching thanks data for period {thanks_start} - {thanks_end}"
+        "[%s] Fetching thanks data for period %s - %s",
+        model_name,
+        thanks_start,
+        thanks_end,
     )
     thanks_results = await fetch_thanks_reports(
         api, thanks_unit_ids, thanks_start, thanks_end
     )
 
-    kpi_data = aggregate_kpi_data(
-        api_results, model_class, extraction_period, thanks_results
-    )
+    kpi_data = aggregate_kpi_data(api_results, extraction_period, thanks_results)
     if not kpi_data:
-        logger.warning(f"[{model_name}] No KPI data aggregated after processing")
+        logger.warning("[%s] No KPI data aggregated after processing", model_name)
         return 0
 
-    logger.info(f"[{model_name}] Aggregated {len(kpi_data)} employee records")
+    logger.info("[%s] Aggregated %s employee records", model_name, len(kpi_data))
     saved_count = await save_kpi_data(kpi_data, model_class)
-    logger.info(f"[{model_name}] Saved {saved_count} records to database")
+    logger.info("[%s] Saved %s records to database", model_name, saved_count)
     return saved_count
 
 
@@ -379,20 +419,22 @@ async def process_kpi(
 async def fill_day_kpi(api: UreAPI) -> None:
     """Fill daily KPI data and update with user_id and questions count."""
     extraction_date = get_yesterday_date()
-    logger.info(f"Starting daily KPI data update for {extraction_date}")
+    logger.info("Starting daily KPI data update for %s", extraction_date)
     count = await process_kpi(api, SpecDayKPI, extraction_date)
-    logger.info(f"Daily KPI data update completed: {count} records")
+    logger.info("Daily KPI data update completed: %s records", count)
 
     # Update with user_id and questions count after filling
     update_count = await update_kpi_with_user_id_and_questions(SpecDayKPI, extraction_date)
-    logger.info(f"Daily KPI user_id and questions update completed: {update_count} records")
+    logger.info(
+        "Daily KPI user_id and questions update completed: %s records", update_count
+    )
 
 
 @log_processing_time("Weekly KPI data processing")
 async def fill_week_kpi(api: UreAPI) -> None:
     """Fill weekly KPI data and update with user_id and questions count."""
     extraction_date = get_week_start_date()
-    logger.info(f"Starting weekly KPI data update for {extraction_date}")
+    logger.info("Starting weekly KPI data update for %s", extraction_date)
     count = await process_kpi(
         api,
         SpecWeekKPI,
@@ -400,32 +442,37 @@ async def fill_week_kpi(api: UreAPI) -> None:
         start_date=extraction_date,
         use_week_period=True,
     )
-    logger.info(f"Weekly KPI data update completed: {count} records")
+    logger.info("Weekly KPI data update completed: %s records", count)
 
     # Update with user_id and questions count after filling
     update_count = await update_kpi_with_user_id_and_questions(SpecWeekKPI, extraction_date)
-    logger.info(f"Weekly KPI user_id and questions update completed: {update_count} records")
+    logger.info(
+        "Weekly KPI user_id and questions update completed: %s records", update_count
+    )
 
 
 @log_processing_time("Monthly KPI data processing")
 async def fill_month_kpi(api: UreAPI) -> None:
     """Fill monthly KPI data and update with user_id and questions count."""
     extraction_date = get_month_period_for_kpi()
-    logger.info(f"Starting monthly KPI data update for {extraction_date}")
+    logger.info("Starting monthly KPI data update for %s", extraction_date)
     count = await process_kpi(
         api, SpecMonthKPI, extraction_date, start_date=extraction_date
     )
-    logger.info(f"Monthly KPI data update completed: {count} records")
+    logger.info("Monthly KPI data update completed: %s records", count)
 
     # Update with user_id and questions count after filling
     update_count = await update_kpi_with_user_id_and_questions(SpecMonthKPI, extraction_date)
-    logger.info(f"Monthly KPI user_id and questions update completed: {update_count} records")
+    logger.info(
+        "Monthly KPI user_id and questions update completed: %s records", update_count
+    )
 
 
 @log_processing_time("All KPI data processing")
 async def fill_kpi(api: UreAPI) -> None:
     """Fill all KPI types."""
     logger.info("Starting full KPI data update (day, week, month)")
+    # gather lets the other fills run to completion if one of them fails
     await asyncio.gather(fill_day_kpi(api), fill_week_kpi(api), fill_month_kpi(api))
     logger.info("Full KPI data update completed")
 
@@ -444,7 +491,9 @@ async def update_kpi_with_user_id_and_questions(
     """
     model_name = model_class.__name__
     logger.info(
-        f"[{model_name}] Updating user_id and questions count for period: {extraction_period}"
+        "[%s] Updating user_id and questions count for period: %s",
+        model_name,
+        extraction_period,
     )
 
     # Step 1: Fetch employee_id -> user_id mapping from STP.employees
@@ -458,32 +507,18 @@ async def update_kpi_with_user_id_and_questions(
             row.employee_id: row.user_id for row in employee_result.fetchall()
         }
 
-    logger.info(f"[{model_name}] Found {len(employee_user_map)} employee -> user mappings")
+    logger.info(
+        "[%s] Found %s employee -> user mappings", model_name, len(employee_user_map)
+    )
 
     if not employee_user_map:
-        logger.warning(f"[{model_name}] No employee-user mappings found")
+        logger.warning("[%s] No employee-user mappings found", model_name)
         return 0
 
     # Step 3: Calculate period boundaries for questions query
-    if model_name == "SpecDayKPI":
-        # For daily KPI, questions from start of day to end of day
-        period_start = extraction_period.replace(hour=0, minute=0, second=0, microsecond=0)
-        period_end = period_start + timedelta(days=1)
-    elif model_name == "SpecWeekKPI":
-        # For weekly KPI, questions from start of week to end of week (7 days)
-        period_start = extraction_period.replace(hour=0, minute=0, second=0, microsecond=0)
-        period_end = period_start + timedelta(days=7)
-    else:  # SpecMonthKPI
-        # For monthly KPI, questions from start of month to start of next month
-        period_start = extraction_period.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        if extraction_period.month == 12:
-            period_end = period_start.replace(year=extraction_period.year + 1, month=1)
-        else:
-            period_end = period_start.replace(month=extraction_period.month + 1)
+    period_start, period_end = get_period_bounds(model_class, extraction_period)
 
-    logger.info(
-        f"[{model_name}] Query period: {period_start} to {period_end}"
-    )
+    logger.info("[%s] Query period: %s to %s", model_name, period_start, period_end)
 
     # Step 4: Fetch questions for the period
     async with get_questions_session() as questions_session:
@@ -523,8 +558,10 @@ async def update_kpi_with_user_id_and_questions(
             questions_asked_map[employee_id] = questions_asked_map.get(employee_id, 0) + count
 
     logger.info(
-        f"[{model_name}] Found {len(questions_answered_map)} users with answered questions "
-        f"and {len(questions_asked_map)} users with asked questions"
+        "[%s] Found %s users with answered questions and %s users with asked questions",
+        model_name,
+        len(questions_answered_map),
+        len(questions_asked_map),
     )
 
     # Step 5: Update KPI records with user_id and questions count
@@ -538,27 +575,36 @@ async def update_kpi_with_user_id_and_questions(
         )
         kpi_records = kpi_result.scalars().all()
 
-        logger.info(f"[{model_name}] Found {len(kpi_records)} KPI records for period")
+        logger.info(
+            "[%s] Found %s KPI records for period", model_name, len(kpi_records)
+        )
 
         if not kpi_records:
-            logger.warning(f"[{model_name}] No KPI records found for period {extraction_period}")
+            logger.warning(
+                "[%s] No KPI records found for period %s", model_name, extraction_period
+            )
             return 0
 
         for kpi in kpi_records:
-            if kpi.employee_id in employee_user_map:
-                kpi.user_id = employee_user_map[kpi.employee_id]
+            user_id = employee_user_map.get(kpi.employee_id)
+            if user_id is None:
+                continue
 
-                # Update questions count
-                kpi.q_answered = questions_answered_map.get(kpi.user_id, 0)
-                kpi.q_asked = questions_asked_map.get(kpi.user_id, 0)
-                # Note: q_asked_conversion is a STORED GENERATED column, calculated automatically by DB
+            kpi.user_id = user_id
 
-                updated_count += 1
+            # Update questions count
+            kpi.q_answered = questions_answered_map.get(user_id, 0)
+            kpi.q_asked = questions_asked_map.get(user_id, 0)
+            # Note: q_asked_conversion is a STORED GENERATED column, calculated automatically by DB
+
+            updated_count += 1
 
         await stats_session.commit()
 
     logger.info(
-        f"[{model_name}] Updated {updated_count} KPI records with user_id and questions count"
+        "[%s] Updated %s KPI records with user_id and questions count",
+        model_name,
+        updated_count,
     )
     return updated_count
 
@@ -567,9 +613,11 @@ async def update_kpi_with_user_id_and_questions(
 async def update_day_kpi_user_id_and_questions() -> int:
     """Update daily KPI records with user_id and questions count."""
     extraction_date = get_yesterday_date()
-    logger.info(f"Starting daily KPI user_id and questions update for {extraction_date}")
+    logger.info(
+        "Starting daily KPI user_id and questions update for %s", extraction_date
+    )
     count = await update_kpi_with_user_id_and_questions(SpecDayKPI, extraction_date)
-    logger.info(f"Daily KPI user_id and questions update completed: {count} records")
+    logger.info("Daily KPI user_id and questions update completed: %s records", count)
     return count
 
 
@@ -577,9 +625,11 @@ async def update_day_kpi_user_id_and_questions() -> int:
 async def update_week_kpi_user_id_and_questions() -> int:
     """Update weekly KPI records with user_id and questions count."""
     extraction_date = get_week_start_date()
-    logger.info(f"Starting weekly KPI user_id and questions update for {extraction_date}")
+    logger.info(
+        "Starting weekly KPI user_id and questions update for %s", extraction_date
+    )
     count = await update_kpi_with_user_id_and_questions(SpecWeekKPI, extraction_date)
-    logger.info(f"Weekly KPI user_id and questions update completed: {count} records")
+    logger.info("Weekly KPI user_id and questions update completed: %s records", count)
     return count
 
 
@@ -587,9 +637,11 @@ async def update_week_kpi_user_id_and_questions() -> int:
 async def update_month_kpi_user_id_and_questions() -> int:
     """Update monthly KPI records with user_id and questions count."""
     extraction_date = get_month_period_for_kpi()
-    logger.info(f"Starting monthly KPI user_id and questions update for {extraction_date}")
+    logger.info(
+        "Starting monthly KPI user_id and questions update for %s", extraction_date
+    )
     count = await update_kpi_with_user_id_and_questions(SpecMonthKPI, extraction_date)
-    logger.info(f"Monthly KPI user_id and questions update completed: {count} records")
+    logger.info("Monthly KPI user_id and questions update completed: %s records", count)
     return count
 
 
@@ -603,4 +655,6 @@ async def update_all_kpi_user_id_and_questions() -> None:
         update_month_kpi_user_id_and_questions(),
     )
     total = sum(results)
-    logger.info(f"Full KPI user_id and questions update completed: {total} total records")
+    logger.info(
+        "Full KPI user_id and questions update completed: %s total records", total
+    )